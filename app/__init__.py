@@ -6,10 +6,9 @@ from flask import Flask
 from app.config import Config
 from app.logging_setup import configure_global_logging
 from app.notifications.notifier import Notifier
-from app.notifications.providers.google_chat import GoogleChatProvider
 from app.persistence.file_repository import FileWatchdogRepository
-from app.services.watchdog_monitor import WatchdogMonitor
 from app.services.watchdog_service import WatchdogService
+from app.web.json_provider import install_json_provider
 from app.web.routes import init_routes
 
 
@@ -32,7 +31,11 @@ def create_app() -> Flask:
     notifier = Notifier()
 
     # Add notification providers if configured
+    # Imported lazily so requests/urllib3 stay out of the cold-start path
+    # when no webhook is configured
     if config.google_chat_webhook_url:
+        from app.notifications.providers.google_chat import GoogleChatProvider
+
         google_chat = GoogleChatProvider(config.google_chat_webhook_url)
         notifier.add_provider(google_chat)
 
@@ -43,19 +46,27 @@ def create_app() -> Flask:
 
     # Create Flask application
     app = Flask(__name__)
+    # Use orjson for request parsing and jsonify when available
+    install_json_provider(app)
+    # Watchdog payloads are tiny; cap the body size so oversized requests
+    # are rejected instead of parsed (memory/CPU DoS surface)
+    app.config["MAX_CONTENT_LENGTH"] = 256 * 1024
 
     # Register routes
     app.register_blueprint(init_routes(watchdog_service))
 
     # Start monitor thread if not running in Gunicorn
     if not os.environ.get("RUNNING_IN_GUNICORN", ""):
+        from app.services.watchdog_monitor import WatchdogMonitor
+
         monitor = WatchdogMonitor(watchdog_service, notifier, config)
         monitor.start()
         logger.info("Started watchdog monitor thread in standalone mode")
 
     logger.info(
-        f"Starting Watchdog Service (timeout: {config.watchdog_timeout}s, "
-        f"expected alertname: {config.expected_alertname})"
+        "Starting Watchdog Service (timeout: %ss, expected alertname: %s)",
+        config.watchdog_timeout,
+        config.expected_alertname,
     )
 
     return app
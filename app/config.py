@@ -1,33 +1,61 @@
 import logging
 import os
-from typing import Optional
+from dataclasses import dataclass
+from typing import ClassVar, Optional
+
+# Precomputed name -> level mapping, avoids getattr probing on the logging
+# module; includes the WARN/FATAL aliases getattr used to resolve
+_LOG_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARN,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+}
+
+
+@dataclass(slots=True)
+class Config:
+    """Centralized configuration management, read from the environment once"""
 
+    # Logger configuration
+    log_level_name: str
+    log_level: int
 
-class Config:
-    """Centralized configuration management"""
+    # Persistence configuration
+    data_dir: str
+    persistence_file: str
+
+    # Notification configuration
+    google_chat_webhook_url: Optional[str]
+
+    # Watchdog configuration
+    watchdog_timeout: int
+    expected_alertname: str
+    alert_resend_interval: int
 
     # Singleton instance
-    _instance: Optional["Config"] = None
+    _instance: ClassVar[Optional["Config"]] = None
 
     @classmethod
     def get_instance(cls) -> "Config":
         if cls._instance is None:
-            cls._instance = cls()
+            cls._instance = cls.from_env()
         return cls._instance
 
-    def __init__(self) -> None:
-        # Logger configuration
-        self.log_level_name: str = os.getenv("LOG_LEVEL", "DEBUG").upper()
-        self.log_level: int = getattr(logging, self.log_level_name, logging.DEBUG)
-
-        # Persistence configuration
-        self.data_dir: str = os.getenv("DATA_DIR", "/app/data")
-        self.persistence_file: str = os.path.join(self.data_dir, "watchdog_state.json")
-
-        # Notification configuration
-        self.google_chat_webhook_url: Optional[str] = os.getenv("GOOGLE_CHAT_WEBHOOK_URL")
-
-        # Watchdog configuration
-        self.watchdog_timeout: int = int(os.getenv("WATCHDOG_TIMEOUT", "3600"))  # Default 1 hour
-        self.expected_alertname: str = os.getenv("EXPECTED_ALERTNAME", "Watchdog")
-        self.alert_resend_interval: int = int(os.getenv("ALERT_RESEND_INTERVAL", "21600"))  # Default 6 hours
+    @classmethod
+    def from_env(cls) -> "Config":
+        log_level_name = os.getenv("LOG_LEVEL", "DEBUG").upper()
+        data_dir = os.getenv("DATA_DIR", "/app/data")
+        return cls(
+            log_level_name=log_level_name,
+            log_level=_LOG_LEVELS.get(log_level_name, logging.DEBUG),
+            data_dir=data_dir,
+            persistence_file=os.path.join(data_dir, "watchdog_state.json"),
+            google_chat_webhook_url=os.getenv("GOOGLE_CHAT_WEBHOOK_URL"),
+            watchdog_timeout=int(os.getenv("WATCHDOG_TIMEOUT", "3600")),  # Default 1 hour
+            expected_alertname=os.getenv("EXPECTED_ALERTNAME", "Watchdog"),
+            alert_resend_interval=int(os.getenv("ALERT_RESEND_INTERVAL", "21600")),  # Default 6 hours
+        )
@@ -1,11 +1,30 @@
+import functools
+import sys
 import time
-from datetime import datetime
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+
+@functools.lru_cache(maxsize=128)
+def _format_utc(int_timestamp: int) -> str:
+    """Format a truncated timestamp, caching repeated formats of the same second"""
+    return datetime.fromtimestamp(int_timestamp, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
 
 class WatchdogState:
     """Domain entity representing the watchdog state"""
 
+    __slots__ = (
+        "last_watchdog_time",
+        "last_watchdog_details",
+        "status",
+        "total_received",
+        "invalid_received",
+        "last_status_notification",
+        "last_alert_notification",
+        "_details_key",
+    )
+
     def __init__(self) -> None:
         self.last_watchdog_time: float = 0
         self.last_watchdog_details: Dict[str, Any] = {}
@@ -14,6 +33,9 @@ class WatchdogState:
         self.invalid_received: int = 0
         self.last_status_notification: float = 0
         self.last_alert_notification: float = 0
+        # Content key of last_watchdog_details (everything but received_at),
+        # used to avoid rebuilding the dict for identical payloads
+        self._details_key: Optional[Tuple[str, str, str, str]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert state to a dictionary for serialization"""
@@ -34,24 +56,47 @@ class WatchdogState:
 
         self.last_watchdog_time = data.get("last_watchdog_time", self.last_watchdog_time)
         self.last_watchdog_details = data.get("last_watchdog_details", self.last_watchdog_details)
-        self.status = data.get("status", self.status)
+        self._details_key = None
+        # Intern the status so the hot equality checks against the literal
+        # states ("ok", "alert", ...) short-circuit on pointer identity
+        status = data.get("status", self.status)
+        self.status = sys.intern(status) if isinstance(status, str) else status
         self.total_received = data.get("total_received", self.total_received)
         self.invalid_received = data.get("invalid_received", self.invalid_received)
         self.last_status_notification = data.get("last_status_notification", self.last_status_notification)
         self.last_alert_notification = data.get("last_alert_notification", self.last_alert_notification)
         return self
 
-    def record_watchdog_alert(self, alert_data: Dict[str, Any]) -> "WatchdogState":
-        """Record a received watchdog alert"""
-        current_time = time.time()
+    def record_watchdog_alert(self, alert_data: Dict[str, Any], now: Optional[float] = None) -> "WatchdogState":
+        """Record a received watchdog alert
+
+        ``now`` lets callers reuse one wall-clock read for a burst of updates.
+        """
+        current_time = time.time() if now is None else now
         self.last_watchdog_time = current_time
-        self.last_watchdog_details = {
-            "alertname": alert_data.get("labels", {}).get("alertname", "unknown"),
-            "status": alert_data.get("status", "unknown"),
-            "summary": alert_data.get("annotations", {}).get("summary", "No summary provided"),
-            "description": alert_data.get("annotations", {}).get("description", "No description provided"),
-            "received_at": self.format_timestamp(current_time),
-        }
+
+        annotations = alert_data.get("annotations", {})
+        details_key = (
+            alert_data.get("labels", {}).get("alertname", "unknown"),
+            alert_data.get("status", "unknown"),
+            annotations.get("summary", "No summary provided"),
+            annotations.get("description", "No description provided"),
+        )
+        if details_key == self._details_key and self.last_watchdog_details:
+            # Same payload as last time (the usual Watchdog cadence) - only
+            # the receive timestamp changed
+            self.last_watchdog_details["received_at"] = self.format_timestamp(current_time)
+        else:
+            alertname, alert_status, summary, description = details_key
+            self.last_watchdog_details = {
+                "alertname": alertname,
+                "status": alert_status,
+                "summary": summary,
+                "description": description,
+                "received_at": self.format_timestamp(current_time),
+            }
+            self._details_key = details_key
+
         self.status = "ok"
         return self
 
@@ -61,14 +106,14 @@ class WatchdogState:
         self.total_received += 1
         return self
 
-    def update_status_notification(self) -> "WatchdogState":
+    def update_status_notification(self, now: Optional[float] = None) -> "WatchdogState":
         """Update the last status notification time"""
-        self.last_status_notification = time.time()
+        self.last_status_notification = time.time() if now is None else now
         return self
 
-    def update_alert_notification(self) -> "WatchdogState":
+    def update_alert_notification(self, now: Optional[float] = None) -> "WatchdogState":
         """Update the last alert notification time"""
-        self.last_alert_notification = time.time()
+        self.last_alert_notification = time.time() if now is None else now
         return self
 
     def set_alert_status(self) -> "WatchdogState":
@@ -93,6 +138,4 @@ class WatchdogState:
         """Format a timestamp as a human-readable string in UTC"""
         if timestamp == 0:
             return "never"
-        from datetime import timezone
-
-        return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        return _format_utc(int(timestamp))
@@ -1,17 +1,31 @@
 import logging
 import os
+from typing import Optional, Tuple
+
+# (level, handler) from the last successful setup; lets repeated calls
+# (create_app per test, gunicorn + app both configuring) become no-ops
+_configured: Optional[Tuple[int, logging.Handler]] = None
 
 
 def configure_global_logging() -> int:
+    global _configured
+
     log_level_name = os.getenv("LOG_LEVEL", "INFO").upper()
     log_level: int = getattr(logging, log_level_name, logging.INFO)
 
+    root_logger = logging.getLogger()
+
+    # Skip the handler churn if our setup is still in place unchanged
+    if _configured is not None:
+        configured_level, configured_handler = _configured
+        if configured_level == log_level and root_logger.handlers == [configured_handler]:
+            return log_level
+
     # Consistent format for app and gunicorn
     log_format = "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
 
     # Configure root logger
-    root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
     # Remove existing handlers to avoid duplicates
@@ -28,5 +42,6 @@ def configure_global_logging() -> int:
     logger = logging.getLogger("watchdog_service")
     logger.setLevel(log_level)
 
-    logger.debug(f"Logging initialized (level: {log_level_name})")
+    _configured = (log_level, handler)
+    logger.debug("Logging initialized (level: %s)", log_level_name)
     return log_level
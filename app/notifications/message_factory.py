@@ -1,41 +1,55 @@
+import functools
+
+# Templates are built once at import; the factory methods only substitute the
+# volatile fields
+_ALERT_TMPL = (
+    "*(ERROR) Watchdog alert - Missing*\n"
+    "Description: No Alertmanager Watchdog messages received in the last {secs} seconds.\n"
+    "Last watchdog message was received at: {ts}\n"
+    "Summary: Alerting pipeline might be broken or Alertmanager unreachable"
+)
+
+_REPEATED_ALERT_TMPL = (
+    "*(ERROR) Watchdog alert - Still Missing*\n"
+    "Description: No Alertmanager Watchdog messages received in the last {secs} seconds.\n"
+    "Last watchdog message was received at: {ts}\n"
+    "Summary: Alerting pipeline might still be broken or Alertmanager unreachable"
+)
+
+_RECOVERY_MESSAGE = (
+    "*(INFO) Watchdog recovered*\n"
+    "Description: Alertmanager Watchdog messages are being received again.\n"
+    "Summary: Alerting pipeline has recovered"
+)
+
+_STATUS_TMPL = (
+    "*(INFO) Watchdog status - OK*\n"
+    "Description: Alertmanager Watchdog messages are being received normally.\n"
+    "Last received: {ts}\n"
+    "Summary: Alerting pipeline is functioning correctly"
+)
+
+
 class MessageFactory:
     """Factory for creating notification messages"""
 
     @staticmethod
     def create_alert_message(time_since_last: float, last_received: str) -> str:
         """Create an initial alert message"""
-        return (
-            f"*(ERROR) Watchdog alert - Missing*\n"
-            f"Description: No Alertmanager Watchdog messages received in the last {int(time_since_last)} seconds.\n"
-            f"Last watchdog message was received at: {last_received}\n"
-            f"Summary: Alerting pipeline might be broken or Alertmanager unreachable"
-        )
+        return _ALERT_TMPL.format_map({"secs": int(time_since_last), "ts": last_received})
 
     @staticmethod
     def create_repeated_alert_message(time_since_last: float, last_received: str) -> str:
         """Create a repeated alert message"""
-        return (
-            f"*(ERROR) Watchdog alert - Still Missing*\n"
-            f"Description: No Alertmanager Watchdog messages received in the last {int(time_since_last)} seconds.\n"
-            f"Last watchdog message was received at: {last_received}\n"
-            f"Summary: Alerting pipeline might still be broken or Alertmanager unreachable"
-        )
+        return _REPEATED_ALERT_TMPL.format_map({"secs": int(time_since_last), "ts": last_received})
 
     @staticmethod
     def create_recovery_message() -> str:
         """Create a recovery message"""
-        return (
-            "*(INFO) Watchdog recovered*\n"
-            "Description: Alertmanager Watchdog messages are being received again.\n"
-            "Summary: Alerting pipeline has recovered"
-        )
+        return _RECOVERY_MESSAGE
 
     @staticmethod
+    @functools.lru_cache(maxsize=16)
     def create_status_message(last_received: str) -> str:
         """Create a status message"""
-        return (
-            f"*(INFO) Watchdog status - OK*\n"
-            f"Description: Alertmanager Watchdog messages are being received normally.\n"
-            f"Last received: {last_received}\n"
-            f"Summary: Alerting pipeline is functioning correctly"
-        )
+        return _STATUS_TMPL.format_map({"ts": last_received})
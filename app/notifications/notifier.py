@@ -1,5 +1,6 @@
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
 
 from app.notifications.message_factory import MessageFactory
 from app.notifications.providers.base_provider import NotificationProvider
@@ -12,28 +13,69 @@ class Notifier:
 
     def __init__(self) -> None:
         self.providers: List[NotificationProvider] = []
+        # Provider names resolved once at registration; name() is a constant
+        # and the error path shouldn't pay a method call per log line
+        self._provider_names: Dict[int, str] = {}
+        # Created lazily on the first multi-provider dispatch
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def add_provider(self, provider: NotificationProvider) -> None:
         """Add a notification provider"""
         self.providers.append(provider)
-        logger.info(f"Added notification provider: {provider.name()}")
+        self._provider_names[id(provider)] = str(provider.name())
+        logger.info("Added notification provider: %s", self._provider_names[id(provider)])
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(2, len(self.providers)),
+                thread_name_prefix="notify",
+            )
+        return self._executor
+
+    def _send_one(self, provider: NotificationProvider, message: str) -> bool:
+        try:
+            return provider.send(message)
+        except Exception as e:
+            name = self._provider_names.get(id(provider), "unknown")
+            logger.error("Error sending notification via %s: %s", name, e)
+            return False
 
     def notify_all(self, message: str) -> bool:
-        """Send notification to all providers"""
+        """Send notification to all providers, dispatching concurrently"""
         if not self.providers:
             logger.warning("No notification providers configured")
             return False
 
-        success = False
-        for provider in self.providers:
-            try:
-                if provider.send(message):
-                    success = True
-            except Exception as e:
-                logger.error(f"Error sending notification via {provider.name()}: {e}")
+        # Single provider (the common deployment) doesn't need the pool
+        if len(self.providers) == 1:
+            return self._send_one(self.providers[0], message)
 
+        futures = [self._get_executor().submit(self._send_one, provider, message) for provider in self.providers]
+        success = False
+        for future in as_completed(futures):
+            if future.result():
+                success = True
         return success
 
+    def notify_async(self, message: str) -> None:
+        """Queue a notification on the dispatch pool without blocking
+
+        Used by the webhook path, where the caller shouldn't wait out a
+        slow provider round trip; delivery failures are logged by
+        _send_one as usual.
+        """
+        if not self.providers:
+            logger.warning("No notification providers configured")
+            return
+        self._get_executor().submit(self.notify_all, message)
+
+    def close(self) -> None:
+        """Shut down the dispatch pool (for clean app teardown)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
     def send_alert(self, time_since_last: float, last_received: str) -> bool:
         """Send an initial alert notification"""
         message = MessageFactory.create_alert_message(time_since_last, last_received)
@@ -49,6 +91,10 @@ class Notifier:
         message = MessageFactory.create_recovery_message()
         return self.notify_all(message)
 
+    def send_recovery_async(self) -> None:
+        """Queue a recovery notification without blocking the caller"""
+        self.notify_async(MessageFactory.create_recovery_message())
+
     def send_status_update(self, last_received: str) -> bool:
         """Send a status update notification"""
         message = MessageFactory.create_status_message(last_received)
@@ -1,6 +1,8 @@
 import logging
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.notifications.providers.base_provider import NotificationProvider
 
@@ -12,6 +14,24 @@ class GoogleChatProvider(NotificationProvider):
 
     def __init__(self, webhook_url: str) -> None:
         self.webhook_url = webhook_url
+        # One pooled session per provider: repeated notifications reuse the
+        # TCP/TLS connection instead of handshaking per send, and transient
+        # 5xx responses are retried with backoff
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                # urllib3 excludes POST from retries by default; the webhook
+                # POST is idempotent for our purposes, so opt it in
+                allowed_methods=frozenset({"POST"}),
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def name(self) -> str:
         return "Google Chat"
@@ -22,18 +42,17 @@ class GoogleChatProvider(NotificationProvider):
             logger.error("GOOGLE_CHAT_WEBHOOK_URL environment variable is not set.")
             return False
 
-        headers = {"Content-Type": "application/json; charset=UTF-8"}
         data = {"text": message}
 
         try:
-            response = requests.post(self.webhook_url, headers=headers, json=data, timeout=10)
+            response = self.session.post(self.webhook_url, json=data, timeout=10)
             if response.status_code == 200:
                 logger.info("Notification sent successfully")
-                logger.debug(f"Notification content: {message}")
+                logger.debug("Notification content: %s", message)
                 return True
             else:
-                logger.error(f"Failed to send notification. Status code: {response.status_code}")
+                logger.error("Failed to send notification. Status code: %s", response.status_code)
                 return False
         except Exception as e:
-            logger.error(f"Exception sending notification: {e}")
+            logger.error("Exception sending notification: %s", e)
             return False
@@ -1,7 +1,14 @@
+import copy
 import json
 import logging
 import os
 import time
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
 
 from app.domain.watchdog_state import WatchdogState
 from app.persistence.repository import WatchdogRepository
@@ -16,6 +23,15 @@ class FileWatchdogRepository(WatchdogRepository):
         super().__init__(data_dir, filename)
         self.log_interval = log_interval
         self._last_log_time = 0.0
+        # Snapshot of the last state written to (or read from) disk, used to
+        # skip redundant rewrites when nothing changed and to serve loads
+        # without re-reading while the file is untouched
+        self._last_saved: Optional[Dict[str, Any]] = None
+        # (st_mtime_ns, st_size) of the file the snapshot corresponds to
+        self._stat_key: Optional[Tuple[int, int]] = None
+        # Paths never change for the repository's lifetime
+        self._filepath = os.path.join(data_dir, filename)
+        self._tmp_filepath = self._filepath + ".tmp"
         self._ensure_data_directory()
 
     def _ensure_data_directory(self) -> None:
@@ -23,38 +39,54 @@ class FileWatchdogRepository(WatchdogRepository):
         if not os.path.exists(self.data_dir):
             try:
                 os.makedirs(self.data_dir, exist_ok=True)
-                logger.info(f"Created data directory at {self.data_dir}")
+                logger.info("Created data directory at %s", self.data_dir)
             except Exception as e:
-                logger.error(f"Failed to create data directory: {e}")
+                logger.error("Failed to create data directory: %s", e)
 
     def load(self) -> WatchdogState:
         """Load watchdog state from file"""
         state = WatchdogState()
-        filepath = os.path.join(self.data_dir, self.filename)
 
-        if os.path.exists(filepath):
+        try:
+            st = os.stat(self._filepath)
+        except FileNotFoundError:
+            st = None
+
+        if st is not None:
             try:
-                with open(filepath, "r") as f:
-                    saved_state = json.load(f)
-                    state.from_dict(saved_state)
+                stat_key = (st.st_mtime_ns, st.st_size)
+                if stat_key == self._stat_key and self._last_saved is not None:
+                    # File unchanged since our last read/write - skip the
+                    # open + parse and rebuild from the cached snapshot
+                    logger.debug("Watchdog state file unchanged, using cached snapshot")
+                    return state.from_dict(copy.deepcopy(self._last_saved))
+
+                with open(self._filepath, "rb") as f:
+                    raw = f.read()
+                saved_state = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                state.from_dict(saved_state)
+                self._last_saved = copy.deepcopy(saved_state)
+                self._stat_key = stat_key
 
                 current_time = time.time()
                 if current_time - self._last_log_time >= self.log_interval:
                     logger.info(
-                        f"Loaded watchdog state: Last alert received at "
-                        f"{WatchdogState.format_timestamp(state.last_watchdog_time)}"
+                        "Loaded watchdog state: Last alert received at %s",
+                        WatchdogState.format_timestamp(state.last_watchdog_time),
                     )
                     self._last_log_time = current_time
                 else:
                     logger.debug(
-                        f"Loaded watchdog state: Last alert received at "
-                        f"{WatchdogState.format_timestamp(state.last_watchdog_time)}"
+                        "Loaded watchdog state: Last alert received at %s",
+                        WatchdogState.format_timestamp(state.last_watchdog_time),
                     )
 
             except Exception as e:
-                logger.error(f"Error loading watchdog state: {e}")
+                logger.error("Error loading watchdog state: %s", e)
                 # Initialize with current time as fallback
                 state.last_watchdog_time = state.last_status_notification = state.last_alert_notification = 0.0
+                self._last_saved = None
+                self._stat_key = None
         else:
             # Initialize with current time for new state
             current_time = time.time()
@@ -65,28 +97,53 @@ class FileWatchdogRepository(WatchdogRepository):
 
         return state
 
-    def save(self, state: WatchdogState) -> bool:
-        """Save watchdog state to file atomically"""
+    def save(self, state: WatchdogState, durable: bool = False) -> bool:
+        """Save watchdog state to file atomically
+
+        The rename publish is atomic against process crashes either way;
+        ``durable`` additionally pays for an fsync so the write survives
+        power loss - worth it for status transitions, not for routine
+        heartbeat saves.
+        """
         try:
-            filepath = os.path.join(self.data_dir, self.filename)
-            tmp_filepath = f"{filepath}.tmp"
+            data = state.to_dict()
+
+            # Skip the rewrite entirely when nothing changed since the last
+            # write/load - read-mostly callers (health checks) hit this path
+            if data == self._last_saved:
+                logger.debug("Watchdog state unchanged, skipping write")
+                return True
+
+            # Serialize up front and write the whole payload in one call
+            # instead of letting the encoder emit many small writes
+            if orjson is not None:
+                payload = orjson.dumps(data)
+            else:
+                payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
 
             # Write to temp file first
-            with open(tmp_filepath, "w") as f:
-                json.dump(state.to_dict(), f)
-                f.flush()
-                os.fsync(f.fileno())  # Ensure data is written to disk
+            with open(self._tmp_filepath, "wb") as f:
+                f.write(payload)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())  # Ensure data is written to disk
 
             # Rename temp file to actual file (atomic operation on POSIX)
-            os.replace(tmp_filepath, filepath)
+            os.replace(self._tmp_filepath, self._filepath)
 
-            logger.debug(f"Saved watchdog state to {filepath}")
+            self._last_saved = copy.deepcopy(data)
+            try:
+                st = os.stat(self._filepath)
+                self._stat_key = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                self._stat_key = None
+            logger.debug("Saved watchdog state to %s", self._filepath)
             return True
         except Exception as e:
-            logger.error(f"Error saving watchdog state: {e}")
-            if "tmp_filepath" in locals() and os.path.exists(tmp_filepath):
+            logger.error("Error saving watchdog state: %s", e)
+            if os.path.exists(self._tmp_filepath):
                 try:
-                    os.remove(tmp_filepath)
+                    os.remove(self._tmp_filepath)
                 except OSError:
                     pass
             return False
@@ -16,6 +16,9 @@ class WatchdogRepository(ABC):
         pass  # pragma: no cover
 
     @abstractmethod
-    def save(self, state: WatchdogState) -> bool:
-        """Save watchdog state to storage"""
+    def save(self, state: WatchdogState, durable: bool = False) -> bool:
+        """Save watchdog state to storage
+
+        ``durable`` requests a disk barrier (fsync) before publishing.
+        """
         pass  # pragma: no cover
@@ -2,7 +2,6 @@ import logging
 import os
 import threading
 import time
-import traceback
 from typing import Tuple
 
 from app.services.watchdog_service import WatchdogService
@@ -45,14 +44,27 @@ class KubernetesProbes:
             return True, "Service is alive"
 
         except Exception as e:
-            logger.error(f"Liveness check error: {str(e)}\n{traceback.format_exc()}")
+            logger.exception("Liveness check error: %s", e)
             return False, f"Liveness check failed: {str(e)}"
 
     def is_monitor_thread_running(self) -> Tuple[bool, str]:
         """Check if the watchdog monitor thread is running using multiple detection methods"""
+        # Method 0: Direct handle check - cheap and authoritative when the
+        # monitor registered itself on the service
+        monitor = getattr(self.watchdog_service, "monitor", None)
+        if monitor is not None:
+            thread = getattr(monitor, "thread", None)
+            if thread is not None and thread.is_alive():
+                self.monitor_thread_detected = True
+                return True, "Monitor thread detected"
+            return False, "Monitor thread is not alive"
+
+        # Fall back to heuristics for deployments where the monitor never
+        # registered (e.g. started out-of-process)
         all_threads = threading.enumerate()
-        thread_names = [t.name for t in all_threads]
-        logger.debug(f"Current threads: {thread_names}")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Only materialize the name list when debug logging is on
+            logger.debug("Current threads: %s", [t.name for t in all_threads])
 
         # Method 1: Check for typical thread names
         monitor_threads = [
@@ -79,7 +91,7 @@ class KubernetesProbes:
             if has_sufficient_threads:
                 return True, "Monitor assumed running (previously detected)"
 
-        return False, f"No monitor thread found (threads: {thread_names})"
+        return False, f"No monitor thread found (threads: {[t.name for t in all_threads]})"
 
     def check_readiness(self) -> Tuple[bool, str]:
         """
@@ -104,14 +116,15 @@ class KubernetesProbes:
                 )
 
             # 3. Check access to file system
+            # A permission check avoids creating and deleting a probe file
+            # on every readiness poll
             try:
                 repo = self.watchdog_service.repository
-                test_file_path = os.path.join(repo.data_dir, ".probe_test")
-                with open(test_file_path, "w") as f:
-                    f.write("probe")
-                os.remove(test_file_path)
+                if not os.access(repo.data_dir, os.W_OK):
+                    logger.warning("File system check failed: %s not writable", repo.data_dir)
+                    # Don't fail readiness only because of filesystem issues
             except Exception as e:
-                logger.warning(f"File system check failed: {str(e)}")
+                logger.warning("File system check failed: %s", e)
                 # Don't fail readiness only because of filesystem issues
                 # return False, f"File system not writable: {str(e)}"
 
@@ -120,7 +133,7 @@ class KubernetesProbes:
             if time.time() - self.startup_time > self.startup_grace_period:
                 thread_running, thread_msg = self.is_monitor_thread_running()
                 if not thread_running:
-                    logger.warning(f"Monitor thread check: {thread_msg}")
+                    logger.warning("Monitor thread check: %s", thread_msg)
 
                     # TEMPORARY WORKAROUND:
                     # If the service has been running for more than 5 minutes and seems otherwise
@@ -149,5 +162,5 @@ class KubernetesProbes:
             return True, "Service is ready to receive traffic"
 
         except Exception as e:
-            logger.error(f"Readiness check error: {str(e)}\n{traceback.format_exc()}")
+            logger.exception("Readiness check error: %s", e)
             return False, f"Readiness check failed: {str(e)}"
@@ -28,8 +28,16 @@ class WatchdogMonitor:
 
         self.thread = threading.Thread(target=self._run_monitor, daemon=True)
         self.thread.start()
+        # Expose the handle so readiness probes can check it directly
+        self.watchdog_service.monitor = self
         logger.info("Started watchdog monitor thread")
 
+    def _wait(self, timeout: float) -> None:
+        """Block until ``timeout`` elapses or an alert wakes the loop early"""
+        wake_event = self.watchdog_service.wake_event
+        if wake_event.wait(timeout):
+            wake_event.clear()
+
     def _run_monitor(self) -> None:
         """Run the monitor loop"""
         logger.info("Starting watchdog monitor loop")
@@ -37,73 +45,109 @@ class WatchdogMonitor:
         if self.watchdog_service.state is None:
             self.watchdog_service.initialize()
 
-        logger.debug(f"Monitor running with service instance {id(self.watchdog_service)}")
+        logger.debug("Monitor running with service instance %s", id(self.watchdog_service))
 
-        # Add a startup grace period to allow watchdog messages to arrive
-        startup_time = time.time()
+        # Add a startup grace period to allow watchdog messages to arrive.
+        # The grace interval is purely in-process, so measure it with the
+        # monotonic clock - immune to NTP steps and container clock skew.
+        # last_watchdog_time stays wall-clock: it is persisted and compared
+        # across restarts, where monotonic readings are meaningless.
+        startup_time = time.monotonic()
         startup_grace_period = float(self.config.watchdog_timeout)
 
         while True:
             try:
                 current_time = time.time()
+                elapsed_since_startup = time.monotonic() - startup_time
 
                 # Skip timeout checks during grace period after startup
-                if current_time - startup_time < startup_grace_period:
+                if elapsed_since_startup < startup_grace_period:
                     logger.debug(
-                        f"In startup grace period ({int(current_time - startup_time)} / {startup_grace_period} seconds)"
+                        "In startup grace period (%d / %s seconds)",
+                        int(elapsed_since_startup),
+                        startup_grace_period,
                     )
-                    time.sleep(30)
+                    self._wait(30.0)
                     continue
 
-                # Use atomic update to check and update state
-                with self.watchdog_service.atomic_update() as state:
-                    last_watchdog_time = state.last_watchdog_time
-                    last_status_notification = state.last_status_notification
-                    last_alert_notification = state.last_alert_notification
-                    current_status = state.status
-
-                    time_since_last = current_time - last_watchdog_time
-                    time_since_last_notification = current_time - last_status_notification
-                    time_since_last_alert = current_time - last_alert_notification
-
-                    logger.debug(
-                        f"time_since_last: ({time_since_last}), watchdog_timeout ({self.config.watchdog_timeout})"
-                    )
+                time_since_last = self.tick(current_time)
 
-                    # Check for watchdog timeout
-                    if time_since_last > self.config.watchdog_timeout:
-                        # Case 1: First alert
-                        if current_status != "alert":
-                            logger.debug("Setting alert state")
-                            state.set_alert_status()
-                            state.update_alert_notification()
-                            last_received = WatchdogState.format_timestamp(state.last_watchdog_time)
-
-                            # Send notification (OUTSIDE lock? No, keep inside to be consistent with state, but quick)
-                            # Actually better to send outside lock to avoid holding it during network IO?
-                            # But we want to ensure we don't send duplicate alerts if multiple threads race
-                            # Holding lock is safer for consistency. Network timeout should be short.
-                            self.notifier.send_alert(time_since_last, last_received)
-
-                        # Case 2: Repeat alert
-                        elif time_since_last_alert >= self.config.alert_resend_interval:
-                            logger.debug("Resending alert notification")
-                            state.update_alert_notification()
-                            last_received = WatchdogState.format_timestamp(last_watchdog_time)
-                            self.notifier.send_repeated_alert(time_since_last, last_received)
-
-                    # Send daily status update if everything is ok
-                    elif current_status == "ok" and time_since_last_notification >= 86400:
-                        logger.debug("Sending daily status update")
-                        state.update_status_notification()
-                        last_received = WatchdogState.format_timestamp(last_watchdog_time)
-                        self.notifier.send_status_update(last_received)
-
-                # Sleep for a while
-                sleep_time = 1.0
-                logger.debug(f"Monitor sleeping for {sleep_time} seconds")
-                time.sleep(sleep_time)
+                # Wait until the next deadline could plausibly be due; a
+                # fresh alert wakes the loop immediately via the service's
+                # wake_event instead of being noticed on the next poll
+                wait_time = min(max(float(self.config.watchdog_timeout) - time_since_last, 1.0), 30.0)
+                logger.debug("Monitor waiting up to %s seconds", wait_time)
+                self._wait(wait_time)
 
             except Exception as e:
-                logger.error(f"Error in watchdog monitor thread: {e}")
+                logger.error("Error in watchdog monitor thread: %s", e)
                 time.sleep(5.0)  # Bei Fehlern kürzere Wartezeit
+
+    def tick(self, current_time: Optional[float] = None) -> float:
+        """Run a single monitor check and send any due notification
+
+        Extracted from the loop body so an external scheduler (or a test)
+        can drive checks directly. Returns seconds since the last watchdog
+        alert so callers can derive the next deadline.
+        """
+        if current_time is None:
+            current_time = time.time()
+
+        config = self.config
+        format_timestamp = WatchdogState.format_timestamp
+
+        # Use atomic update to check and update state; notifications are
+        # decided here but sent after the lock is released
+        notification = None
+        with self.watchdog_service.atomic_update() as state:
+            last_watchdog_time = state.last_watchdog_time
+            last_status_notification = state.last_status_notification
+            last_alert_notification = state.last_alert_notification
+            current_status = state.status
+
+            time_since_last = current_time - last_watchdog_time
+            time_since_last_notification = current_time - last_status_notification
+            time_since_last_alert = current_time - last_alert_notification
+
+            logger.debug(
+                "time_since_last: (%s), watchdog_timeout (%s)", time_since_last, config.watchdog_timeout
+            )
+
+            # Check for watchdog timeout
+            if time_since_last > config.watchdog_timeout:
+                # Case 1: First alert
+                if current_status != "alert":
+                    logger.debug("Setting alert state")
+                    state.set_alert_status()
+                    state.update_alert_notification(current_time)
+                    last_received = format_timestamp(state.last_watchdog_time)
+                    notification = ("alert", time_since_last, last_received)
+
+                # Case 2: Repeat alert
+                elif time_since_last_alert >= config.alert_resend_interval:
+                    logger.debug("Resending alert notification")
+                    state.update_alert_notification(current_time)
+                    last_received = format_timestamp(last_watchdog_time)
+                    notification = ("repeat", time_since_last, last_received)
+
+            # Send daily status update if everything is ok
+            elif current_status == "ok" and time_since_last_notification >= 86400:
+                logger.debug("Sending daily status update")
+                state.update_status_notification(current_time)
+                last_received = format_timestamp(last_watchdog_time)
+                notification = ("status", 0.0, last_received)
+
+        # Send outside the lock so webhook handlers recording alerts don't
+        # stall behind a slow notification call. The persisted notification
+        # timestamps above already de-duplicate sends: a crash between save
+        # and send drops one notification rather than duplicating it.
+        if notification is not None:
+            kind, since, last_received = notification
+            if kind == "alert":
+                self.notifier.send_alert(since, last_received)
+            elif kind == "repeat":
+                self.notifier.send_repeated_alert(since, last_received)
+            else:
+                self.notifier.send_status_update(last_received)
+
+        return time_since_last
@@ -2,16 +2,24 @@ import contextlib
 import fcntl
 import logging
 import os
-from threading import RLock
-from typing import Any, Dict, Generator, Optional, Tuple
+import time
+from threading import Event, Lock, RLock
+from typing import TYPE_CHECKING, Any, Dict, Generator, Optional, Tuple
 
 from app.config import Config
 from app.domain.watchdog_state import WatchdogState
 from app.notifications.notifier import Notifier
 from app.persistence.repository import WatchdogRepository
 
+if TYPE_CHECKING:
+    from app.services.watchdog_monitor import WatchdogMonitor
+
 logger = logging.getLogger("watchdog_service")
 
+# Statuses exempt from health-check alert promotion: right after a restart
+# or fresh start the service may legitimately have no watchdog history yet
+_GRACE_STATES = frozenset(("initializing", "waiting_for_first_alert"))
+
 
 class WatchdogService:
     """Service for managing watchdog alerts"""
@@ -27,6 +35,14 @@ class WatchdogService:
         notifier: Optional[Notifier] = None,
         config: Optional[Config] = None,
     ) -> "WatchdogService":
+        # Fast path: after first initialization every call is a plain
+        # attribute read - no lock acquisition. Safe because _instance is
+        # only ever transitioned None -> fully constructed instance under
+        # the lock below, and CPython attribute stores are atomic.
+        instance = cls._instance
+        if instance is not None:
+            return instance
+
         with cls._lock:
             if cls._instance is None:
                 if repository is None or notifier is None or config is None:
@@ -40,42 +56,87 @@ class WatchdogService:
         self.notifier = notifier
         self.config = config
         self.state: Optional[WatchdogState] = None
-        # RLock for in-process synchronization
-        self.state_lock = RLock()
+        # Set by WatchdogMonitor.start() so probes can check the thread directly
+        self.monitor: Optional["WatchdogMonitor"] = None
+        # Plain lock for in-process synchronization: no code path acquires
+        # it reentrantly (atomic_read/atomic_update are never nested), and
+        # a non-reentrant Lock skips RLock's owner/count bookkeeping
+        self.state_lock = Lock()
+        # Signalled on each processed alert so the monitor wakes immediately
+        # instead of discovering the update on its next poll
+        self.wake_event = Event()
+        # Long-lived fd for the fcntl lock file, opened on first use
+        self._lock_fd: Optional[int] = None
+        # (monotonic expiry, snapshot) for get_health_status; invalidated
+        # by every atomic_update so writers are always reflected
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Static config sub-dict for /status, built on first use
+        self._config_info: Optional[Dict[str, Any]] = None
 
     def initialize(self) -> None:
         """Initialize the service state"""
-        # Ensure data directory exists
-        if not os.path.exists(self.repository.data_dir):
-            os.makedirs(self.repository.data_dir, exist_ok=True)
+        # Ensure data directory exists; unconditional exist_ok avoids the
+        # stat+mkdir pair and the TOCTOU race between them
+        os.makedirs(self.repository.data_dir, exist_ok=True)
 
         # Load state safely
         with self.atomic_update() as _:
             pass  # Just loading is enough as atomic_update loads state
         logger.info("Watchdog service initialized")
 
+    def _get_lock_fd(self) -> int:
+        """Return the lock file descriptor, opening it on first use
+
+        The fd is kept open for the service lifetime; opening per call
+        cost two extra syscalls and truncated the lock file each time.
+        Callers must hold state_lock.
+        """
+        if self._lock_fd is None:
+            filepath = os.path.join(self.repository.data_dir, self.repository.filename)
+            self._lock_fd = os.open(f"{filepath}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        return self._lock_fd
+
     @contextlib.contextmanager
     def atomic_update(self) -> Generator[WatchdogState, None, None]:
         """Context manager for atomic state updates with file locking"""
-        filepath = os.path.join(self.repository.data_dir, self.repository.filename)
-        lock_file = f"{filepath}.lock"
-
         # 1. Acquire process lock
         with self.state_lock:
             # 2. Acquire file lock
-            with open(lock_file, "w") as f_lock:
-                fcntl.flock(f_lock, fcntl.LOCK_EX)
-                try:
-                    # 3. Refresh state from disk
-                    self.state = self.repository.load()
+            lock_fd = self._get_lock_fd()
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            try:
+                # 3. Refresh state from disk
+                self.state = self.repository.load()
+                prev_status = self.state.status
+
+                # 4. Yield state for modification
+                yield self.state
 
-                    # 4. Yield state for modification
-                    yield self.state
+                # 5. Save state to disk; status transitions are the only
+                # changes worth a disk barrier
+                self.repository.save(self.state, durable=self.state.status != prev_status)
+                self._health_cache = None
+            finally:
+                fcntl.flock(lock_fd, fcntl.LOCK_UN)
+
+    @contextlib.contextmanager
+    def atomic_read(self) -> Generator[WatchdogState, None, None]:
+        """Context manager for read-only state access
 
-                    # 5. Save state to disk
-                    self.repository.save(self.state)
-                finally:
-                    fcntl.flock(f_lock, fcntl.LOCK_UN)
+        Takes a shared file lock so concurrent readers don't serialize
+        behind each other, refreshes state from disk, and never writes
+        anything back - the read paths (/health, /status, probes) go
+        through here instead of paying atomic_update's exclusive lock
+        and save cycle.
+        """
+        with self.state_lock:
+            lock_fd = self._get_lock_fd()
+            fcntl.flock(lock_fd, fcntl.LOCK_SH)
+            try:
+                self.state = self.repository.load()
+                yield self.state
+            finally:
+                fcntl.flock(lock_fd, fcntl.LOCK_UN)
 
     def process_watchdog_alert(self, payload: Optional[Dict[str, Any]]) -> Tuple[bool, str]:
         """Process an incoming alert from Alertmanager"""
@@ -85,108 +146,194 @@ class WatchdogService:
         if not isinstance(payload, dict):
             return False, "Invalid payload: Not a dictionary"
 
+        # Parse once, outside the lock - validation and extraction share
+        # the same dict walks
+        expected_alertname = self.config.expected_alertname
+        parsed = self._parse_alert(payload, expected_alertname)
+
+        send_recovery = False
         with self.atomic_update() as state:
             # Increment total counter
             state.total_received += 1
 
-            # Validate watchdog alert format
-            if not self._validate_watchdog_alert(payload):
+            if parsed is None:
                 state.record_invalid_alert()
                 return False, "Invalid watchdog alert format"
 
-            # Get the alert safely
-            alerts = payload.get("alerts", [])
-            alert = alerts[0] if (isinstance(alerts, list) and len(alerts) > 0) else payload
+            alert, alertname = parsed
 
             # Check if it's a watchdog alert
-            alertname = alert.get("labels", {}).get("alertname", "")
-            if alertname != self.config.expected_alertname:
-                logger.warning(f"Received non-watchdog alert: {alertname}")
+            if alertname != expected_alertname:
+                logger.warning("Received non-watchdog alert: %s", alertname)
                 state.record_invalid_alert()
                 return (
                     False,
-                    f"Expected '{self.config.expected_alertname}', got '{alertname}'",
+                    f"Expected '{expected_alertname}', got '{alertname}'",
                 )
 
             # Valid watchdog alert received - update state
-            was_in_alert = state.status == "alert"
+            send_recovery = state.status == "alert"
             state.record_watchdog_alert(alert)
 
-            # If we were in alert state, send recovery notification
-            if was_in_alert:
-                logger.info("Watchdog alert received after previous failure - sending recovery notification")
-                self.notifier.send_recovery()
+        self.wake_event.set()
+
+        # If we were in alert state, send recovery notification - after the
+        # lock is released, so the webhook path never holds the state lock
+        # across a network call. The status transition is already persisted,
+        # which de-duplicates the recovery send across racing alerts.
+        if send_recovery:
+            logger.info("Watchdog alert received after previous failure - sending recovery notification")
+            self.notifier.send_recovery_async()
 
         return True, "Watchdog alert received and processed"
 
+    @staticmethod
+    def _parse_alert(payload: Any, expected_alertname: Optional[str] = None) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Validate and extract the alert in a single pass
+
+        Returns ``(alert, alertname)`` for either the Alertmanager wrapper
+        format or the direct alert format, or ``None`` when the payload has
+        neither shape. When ``expected_alertname`` is given, a batched
+        Alertmanager payload is scanned for the first matching alert (the
+        watchdog may not be first in a grouped batch); without a match the
+        first alert is returned so the caller can report what arrived.
+        """
+        if not isinstance(payload, dict):
+            return None
+
+        if "alerts" in payload:
+            # Format from Alertmanager
+            alerts = payload["alerts"]
+            if not isinstance(alerts, list) or not alerts:
+                return None
+            if expected_alertname is not None:
+                match = next(
+                    (
+                        a
+                        for a in alerts
+                        if isinstance(a, dict) and a.get("labels", {}).get("alertname") == expected_alertname
+                    ),
+                    None,
+                )
+                if match is not None:
+                    return match, expected_alertname
+            alert = alerts[0]
+        elif "labels" in payload:
+            # Direct alert format
+            alert = payload
+        else:
+            return None
+
+        labels = alert.get("labels") if isinstance(alert, dict) else None
+        alertname = labels.get("alertname", "") if isinstance(labels, dict) else ""
+        return alert, alertname
+
     def _validate_watchdog_alert(self, payload: Any) -> bool:
         """Validate the alert has the expected format"""
-        if isinstance(payload, dict):
-            if "alerts" in payload:
-                # Format from Alertmanager
-                alerts = payload["alerts"]
-                if isinstance(alerts, list) and len(alerts) > 0:
-                    return True
-            elif "labels" in payload:
-                # Direct alert format
-                return True
-        return False
+        return self._parse_alert(payload) is not None
+
+    def _health_snapshot(self, state: WatchdogState, time_since_last: float) -> Dict[str, Any]:
+        """Build the health dict from the given state (caller holds a lock)"""
+        return {
+            "status": state.status,
+            "is_healthy": state.status == "ok",
+            "last_ping": state.last_watchdog_time,
+            "last_ping_formatted": state.format_timestamp(state.last_watchdog_time),
+            "time_since_last_ping": time_since_last,
+            "timeout": self.config.watchdog_timeout,
+        }
+
+    def _timeout_exceeded(self, state: WatchdogState, time_since_last: float) -> bool:
+        """Whether the state should be promoted to alert by a health check"""
+        if time_since_last <= self.config.watchdog_timeout:
+            return False
+        status = state.status
+        return status != "alert" and status not in _GRACE_STATES
+
+    # Liveness probes poll /health at up to a few Hz; within this window
+    # repeated hits serve the same snapshot without touching lock or disk
+    _HEALTH_CACHE_TTL = 1.0
 
     def get_health_status(self) -> Dict[str, Any]:
         """Get system health status"""
-        # Read-only access doesn't strictly need exclusive lock for consistency
-        # but for simplicity and safety we use it to avoid reading partial writes
+        cached = self._health_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        # The common case is read-only: shared lock, no save. The elapsed
+        # time is computed once and reused for the check and the snapshot.
+        with self.atomic_read() as state:
+            time_since_last = state.time_since_last_watchdog()
+            if not self._timeout_exceeded(state, time_since_last):
+                health_status = self._health_snapshot(state, time_since_last)
+                self._health_cache = (time.monotonic() + self._HEALTH_CACHE_TTL, health_status)
+                return health_status
+
+        # Timeout exceeded - take the exclusive path and re-check, since a
+        # watchdog alert may have landed between the two locks
         with self.atomic_update() as state:
             time_since_last = state.time_since_last_watchdog()
+            if self._timeout_exceeded(state, time_since_last):
+                logger.warning(
+                    "Watchdog timeout exceeded in health check: %.1fs > %ss",
+                    time_since_last,
+                    self.config.watchdog_timeout,
+                )
+                state.set_alert_status()
+            health_status = self._health_snapshot(state, time_since_last)
+
+        # Cached after the block: atomic_update's exit invalidates the cache
+        self._health_cache = (time.monotonic() + self._HEALTH_CACHE_TTL, health_status)
+        return health_status
 
-            # Status update if timeout exceeded
-            if time_since_last > self.config.watchdog_timeout and state.status != "alert":
-                # Check for startup grace period
-                # We assume a grace period of 2 * timeout to avoid false positives on restart
-                # if we just lost state or it's a fresh start
-                if state.status == "initializing" or state.status == "waiting_for_first_alert":
-                    # Allow some time for hydration
-                    pass
-                else:
-                    logger.warning(
-                        f"Watchdog timeout exceeded in health check: "
-                        f"{time_since_last:.1f}s > {self.config.watchdog_timeout}s"
-                    )
-                    state.set_alert_status()
-
-            # Calculate health
-            is_healthy = state.status == "ok"
-
-            health_status = {
-                "status": state.status,
-                "is_healthy": is_healthy,
-                "last_ping": state.last_watchdog_time,
-                "last_ping_formatted": state.format_timestamp(state.last_watchdog_time),
-                "time_since_last_ping": state.time_since_last_watchdog(),
-                "timeout": self.config.watchdog_timeout,
+    def _get_config_info(self) -> Dict[str, Any]:
+        """Return the static config section of /status, built once
+
+        Config doesn't change after startup, so rebuilding this dict per
+        request was pure allocation churn. Lazy rather than eager so test
+        fixtures that adjust Config after constructing the service are
+        still reflected on first use.
+        """
+        config_info = self._config_info
+        if config_info is None:
+            config_info = self._config_info = {
+                "watchdog_timeout": self.config.watchdog_timeout,
+                "expected_alertname": self.config.expected_alertname,
+                "alert_resend_interval": self.config.alert_resend_interval,
             }
+        return config_info
 
-        return health_status
+    def _detailed_snapshot(self, state: WatchdogState, time_since_last: float) -> Dict[str, Any]:
+        """Build the detailed status dict (caller holds a lock)"""
+        detailed_status = self._health_snapshot(state, time_since_last)
+        detailed_status.update(
+            {
+                "total_received": state.total_received,
+                "invalid_received": state.invalid_received,
+                "last_watchdog_details": state.last_watchdog_details,
+                "last_status_notification": state.format_timestamp(state.last_status_notification),
+                "last_alert_notification": state.format_timestamp(state.last_alert_notification),
+                "config": self._get_config_info(),
+            }
+        )
+        return detailed_status
 
     def get_detailed_status(self) -> Dict[str, Any]:
         """Get detailed system status"""
-        health_status = self.get_health_status()
+        # Mirror get_health_status but take the lock only once: read-only
+        # in the common case, exclusive only to promote an exceeded timeout
+        with self.atomic_read() as state:
+            time_since_last = state.time_since_last_watchdog()
+            if not self._timeout_exceeded(state, time_since_last):
+                return self._detailed_snapshot(state, time_since_last)
 
         with self.atomic_update() as state:
-            detailed_status = health_status.copy()
-            detailed_status.update(
-                {
-                    "total_received": state.total_received,
-                    "invalid_received": state.invalid_received,
-                    "last_watchdog_details": state.last_watchdog_details,
-                    "last_status_notification": state.format_timestamp(state.last_status_notification),
-                    "last_alert_notification": state.format_timestamp(state.last_alert_notification),
-                    "config": {
-                        "watchdog_timeout": self.config.watchdog_timeout,
-                        "expected_alertname": self.config.expected_alertname,
-                        "alert_resend_interval": self.config.alert_resend_interval,
-                    },
-                }
-            )
-
-        return detailed_status
+            time_since_last = state.time_since_last_watchdog()
+            if self._timeout_exceeded(state, time_since_last):
+                logger.warning(
+                    "Watchdog timeout exceeded in health check: %.1fs > %ss",
+                    time_since_last,
+                    self.config.watchdog_timeout,
+                )
+                state.set_alert_status()
+            return self._detailed_snapshot(state, time_since_last)
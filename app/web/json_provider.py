@@ -0,0 +1,30 @@
+from typing import Any
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson
+
+    Speeds up request.get_json() on incoming Alertmanager payloads and
+    jsonify() on the status endpoints. orjson.JSONDecodeError subclasses
+    json.JSONDecodeError, so Flask's silent-parse handling keeps working.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default).decode("utf-8")
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+def install_json_provider(app: Flask) -> None:
+    """Switch the app to the orjson provider when the library is present"""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
@@ -11,6 +11,48 @@ from app.services.watchdog_service import WatchdogService
 bp = Blueprint("routes", __name__)
 logger = logging.getLogger("watchdog_service")
 
+# The root endpoint's body never changes; build it once at import
+_SERVICE_INFO = {
+    "service": "Alertmanager Watchdog Service",
+    "version": "2.0.0",
+    "status": "running",
+    "endpoints": [
+        {
+            "path": "/watchdog",
+            "method": "POST",
+            "description": "Endpoint for Alertmanager webhook",
+        },
+        {
+            "path": "/health",
+            "method": "GET",
+            "description": "Health check endpoint",
+        },
+        {
+            "path": "/status",
+            "method": "GET",
+            "description": "Detailed status information",
+        },
+        {
+            "path": "/probe/liveness",
+            "method": "GET",
+            "description": "Kubernetes liveness probe endpoint",
+        },
+        {
+            "path": "/probe/readiness",
+            "method": "GET",
+            "description": "Kubernetes readiness probe endpoint",
+        },
+    ],
+}
+
+# Precomputed body for the /watchdog happy path - every successful alert
+# returns exactly this payload, so there is nothing to serialize per hit.
+# Must stay in sync with the success message in
+# WatchdogService.process_watchdog_alert.
+_WATCHDOG_OK_BODY = json.dumps(
+    {"status": "success", "message": "Watchdog alert received and processed"}
+).encode("utf-8")
+
 # We'll inject the service in __init__.py
 watchdog_service: Optional[WatchdogService] = None
 kubernetes_probes: Optional[KubernetesProbes] = None
@@ -27,11 +69,20 @@ def init_routes(service: WatchdogService) -> Blueprint:
 def watchdog() -> Tuple[Response, int]:
     """Endpoint for Alertmanager webhook"""
     try:
-        # Get JSON payload
-        payload = request.get_json(silent=True)
+        # Reject oversized bodies from the Content-Length header alone,
+        # before any of the body is read or parsed
+        max_length = request.max_content_length
+        if max_length is not None and request.content_length is not None and request.content_length > max_length:
+            return jsonify({"status": "error", "message": "Payload too large"}), 413
 
-        # Log the payload for debugging
-        logger.debug(f"Received alert payload: {json.dumps(payload) if payload else 'None'}")
+        # Get JSON payload; cache=False so the parsed tree isn't retained
+        # on the request object after the handler returns
+        payload = request.get_json(silent=True, cache=False)
+
+        # Log the payload for debugging; the json.dumps only runs when
+        # debug logging is actually enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received alert payload: %s", json.dumps(payload) if payload else "None")
 
         # Process the alert
         if watchdog_service is None:
@@ -39,13 +90,16 @@ def watchdog() -> Tuple[Response, int]:
 
         success, message = watchdog_service.process_watchdog_alert(payload)
 
-        if not success and payload is None:
+        if success:
+            return Response(_WATCHDOG_OK_BODY, mimetype="application/json"), 200
+
+        if payload is None:
             return jsonify({"status": "error", "message": message}), 400
 
-        return jsonify({"status": "success" if success else "warning", "message": message}), 200
+        return jsonify({"status": "warning", "message": message}), 200
 
     except Exception as e:
-        logger.error(f"Error processing watchdog request: {str(e)}")
+        logger.error("Error processing watchdog request: %s", e)
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
@@ -111,37 +165,4 @@ def status() -> Tuple[Response, int]:
 @bp.route("/", methods=["GET"])
 def root() -> Tuple[Response, int]:
     """Root endpoint for service information"""
-    return jsonify(
-        {
-            "service": "Alertmanager Watchdog Service",
-            "version": "2.0.0",
-            "status": "running",
-            "endpoints": [
-                {
-                    "path": "/watchdog",
-                    "method": "POST",
-                    "description": "Endpoint for Alertmanager webhook",
-                },
-                {
-                    "path": "/health",
-                    "method": "GET",
-                    "description": "Health check endpoint",
-                },
-                {
-                    "path": "/status",
-                    "method": "GET",
-                    "description": "Detailed status information",
-                },
-                {
-                    "path": "/probe/liveness",
-                    "method": "GET",
-                    "description": "Kubernetes liveness probe endpoint",
-                },
-                {
-                    "path": "/probe/readiness",
-                    "method": "GET",
-                    "description": "Kubernetes readiness probe endpoint",
-                },
-            ],
-        }
-    ), 200
+    return jsonify(_SERVICE_INFO), 200
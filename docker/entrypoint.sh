@@ -12,4 +12,4 @@ echo "- LOG_LEVEL: ${LOG_LEVEL:-'info'}"
 echo "- GOOGLE_CHAT_WEBHOOK_URL: $(if [ -n "$GOOGLE_CHAT_WEBHOOK_URL" ]; then echo "configured"; else echo "not configured"; fi)"
 
 # Starte Gunicorn mit der angegebenen Konfiguration
-exec gunicorn --config gunicorn_config.py "app.watchdog_service:webapp"
+exec gunicorn --config gunicorn_config.py "app:create_app()"
@@ -58,6 +58,8 @@ def app(service: WatchdogService) -> Generator[Flask, None, None]:
     app = Flask(__name__)
     app.register_blueprint(init_routes(service))
     app.config["TESTING"] = True
+    # Mirror create_app's request body cap
+    app.config["MAX_CONTENT_LENGTH"] = 256 * 1024
     yield app
 
 
@@ -9,7 +9,7 @@ from app.notifications.providers.google_chat import GoogleChatProvider
 
 
 class TestAppInit:
-    @patch("app.WatchdogMonitor")
+    @patch("app.services.watchdog_monitor.WatchdogMonitor")
     @patch("app.WatchdogService")
     @patch("app.Notifier")
     @patch("app.FileWatchdogRepository")
@@ -48,7 +48,7 @@ class TestAppInit:
             mock_service_cls.get_instance.assert_called_once()
             mock_service_instance.initialize.assert_called_once()
 
-    @patch("app.WatchdogMonitor")
+    @patch("app.services.watchdog_monitor.WatchdogMonitor")
     @patch("app.WatchdogService")
     @patch("app.Notifier")
     @patch("app.FileWatchdogRepository")
@@ -71,7 +71,7 @@ class TestAppInit:
             args, _ = mock_notifier_instance.add_provider.call_args
             assert isinstance(args[0], GoogleChatProvider)
 
-    @patch("app.WatchdogMonitor")
+    @patch("app.services.watchdog_monitor.WatchdogMonitor")
     @patch("app.WatchdogService")
     @patch("app.Notifier")
     @patch("app.FileWatchdogRepository")
@@ -95,7 +95,7 @@ class TestAppInit:
             mock_monitor_cls.assert_called_once()
             mock_monitor_cls.return_value.start.assert_called_once()
 
-    @patch("app.WatchdogMonitor")
+    @patch("app.services.watchdog_monitor.WatchdogMonitor")
     @patch("app.WatchdogService")
     @patch("app.Notifier")
     @patch("app.FileWatchdogRepository")
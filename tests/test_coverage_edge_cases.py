@@ -1,4 +1,5 @@
 import contextlib
+import logging
 import threading
 import time
 from typing import Any, cast
@@ -27,6 +28,7 @@ class TestCoverageEdgeCases:
         service.repository = repository_mock
         service.state = MagicMock(spec=WatchdogState)
         service.state.status = "ok"
+        service.state.last_watchdog_time = 0.0
         # Setup mock state lock
         service.state_lock = threading.RLock()
 
@@ -139,8 +141,7 @@ class TestCoverageEdgeCases:
     def test_google_chat_send_exception(self) -> None:
         """Test Google Chat send error handling"""
         provider = GoogleChatProvider("http://url")
-        # It uses requests.post, not urllib
-        with patch("requests.post", side_effect=Exception("Network error")):
+        with patch.object(provider.session, "post", side_effect=Exception("Network error")):
             # Should not raise exception
             assert provider.send("Test message") is False
 
@@ -199,15 +200,23 @@ class TestCoverageEdgeCases:
         service_mock.atomic_update = mock_atomic_update
         service_mock.state = state
 
-        # Mock time.time to return [startup_time, loop_iteration_time]
-        with patch("time.time", side_effect=[1000.0, 1100.0]):
-            # We want sleep to raise to break loop on first call (end of loop)
-            with patch("time.sleep", side_effect=Exception("BreakLoop")):
-                try:
-                    monitor._run_monitor()
-                except Exception as e:
-                    if str(e) != "BreakLoop":
-                        raise
+        # Grace period over (monotonic startup=0, now=1000), wall clock at
+        # 1100. Logging is disabled so record creation can't skew the clocks.
+        mono = iter([0.0])
+        logging.disable(logging.CRITICAL)
+        try:
+            with patch("time.time", return_value=1100.0), patch(
+                "time.monotonic", side_effect=lambda: next(mono, 1000.0)
+            ):
+                # We want the end-of-loop wait to raise to break the loop
+                with patch.object(monitor, "_wait", side_effect=InterruptedError()):
+                    with patch("time.sleep", side_effect=InterruptedError()):
+                        try:
+                            monitor._run_monitor()
+                        except InterruptedError:
+                            pass
+        finally:
+            logging.disable(logging.NOTSET)
 
         # Check if repeated alert was sent
         notifier_mock.send_repeated_alert.assert_called()
@@ -227,14 +236,20 @@ class TestCoverageEdgeCases:
         # Sequence: startup_time call, then current_time call in loop
         # We need two iterations to cover 'continue'
         # 1. startup = 100
-        # 2. iter1 current = 110 (diff 10 < 60) -> sleep(30) -> continue
-        # 3. iter2 current = 120 (diff 20 < 60) -> sleep(30) -> RAISE
-        with patch("time.time", side_effect=[100.0, 110.0, 120.0]):
-            with patch("time.sleep", side_effect=[None, Exception("BreakLoop")]):
-                try:
-                    monitor._run_monitor()
-                except Exception:
-                    pass
+        # 2. iter1 current = 110 (diff 10 < 60) -> wait(30) -> continue
+        # 3. iter2 current = 120 (diff 20 < 60) -> wait(30) -> RAISE
+        clock = iter([100.0, 110.0, 120.0])
+        logging.disable(logging.CRITICAL)
+        try:
+            with patch("time.time", side_effect=lambda: next(clock, 120.0)):
+                with patch.object(monitor, "_wait", side_effect=[None, InterruptedError()]):
+                    with patch("time.sleep", side_effect=InterruptedError()):
+                        try:
+                            monitor._run_monitor()
+                        except InterruptedError:
+                            pass
+        finally:
+            logging.disable(logging.NOTSET)
 
         atomic_update_mock.assert_not_called()
 
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from app.notifications.notifier import Notifier
 from app.notifications.providers.base_provider import NotificationProvider
@@ -80,27 +80,27 @@ class TestNotifications:
 
 
 class TestGoogleChatProvider:
-    @patch("requests.post")
-    def test_send_success(self, mock_post: MagicMock) -> None:
-        mock_post.return_value.status_code = 200
+    def test_send_success(self) -> None:
         provider = GoogleChatProvider("http://webhook.url")
-        success = provider.send("Test Message")
+        with patch.object(provider.session, "post") as mock_post:
+            mock_post.return_value.status_code = 200
+            success = provider.send("Test Message")
 
-        assert success is True
-        mock_post.assert_called_once()
-        args, kwargs = mock_post.call_args
-        assert kwargs["json"]["text"] == "Test Message"
+            assert success is True
+            mock_post.assert_called_once()
+            args, kwargs = mock_post.call_args
+            assert kwargs["json"]["text"] == "Test Message"
 
-    @patch("requests.post")
-    def test_send_failure_status(self, mock_post: MagicMock) -> None:
-        mock_post.return_value.status_code = 500
+    def test_send_failure_status(self) -> None:
         provider = GoogleChatProvider("http://webhook.url")
-        success = provider.send("Test Message")
-        assert success is False
+        with patch.object(provider.session, "post") as mock_post:
+            mock_post.return_value.status_code = 500
+            success = provider.send("Test Message")
+            assert success is False
 
-    @patch("requests.post")
-    def test_send_exception(self, mock_post: MagicMock) -> None:
-        mock_post.side_effect = Exception("Network error")
+    def test_send_exception(self) -> None:
         provider = GoogleChatProvider("http://webhook.url")
-        success = provider.send("Test Message")
-        assert success is False
+        with patch.object(provider.session, "post") as mock_post:
+            mock_post.side_effect = Exception("Network error")
+            success = provider.send("Test Message")
+            assert success is False
@@ -34,6 +34,12 @@ class TestRoutes:
         data = response.get_json()
         assert data["status"] == "error"
 
+    def test_watchdog_post_payload_too_large(self, client: FlaskClient) -> None:
+        """Test watchdog rejects oversized payloads before parsing"""
+        body = b"x" * (300 * 1024)
+        response = client.post("/watchdog", data=body, content_type="application/json")
+        assert response.status_code == 413
+
     def test_health_check_ok(self, client: FlaskClient, service: WatchdogService) -> None:
         """Test health check when service is healthy"""
         with patch.object(service, "get_health_status", return_value={"is_healthy": True, "status": "ok"}):
@@ -1,3 +1,4 @@
+import logging
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -40,11 +41,12 @@ class TestWatchdogMonitor:
         with patch.object(monitor.watchdog_service, "initialize") as mock_init:
             with patch("time.time", return_value=1000.0):
                 # Force exit loop immediately
-                with patch("time.sleep", side_effect=InterruptedError()):
-                    try:
-                        monitor._run_monitor()
-                    except InterruptedError:
-                        pass
+                with patch.object(monitor, "_wait", side_effect=InterruptedError()):
+                    with patch("time.sleep", side_effect=InterruptedError()):
+                        try:
+                            monitor._run_monitor()
+                        except InterruptedError:
+                            pass
             mock_init.assert_called_once()
 
     def test_run_monitor_grace_period(self, monitor: WatchdogMonitor) -> None:
@@ -52,14 +54,21 @@ class TestWatchdogMonitor:
         monitor.config.watchdog_timeout = 60
         # 1. startup_time = 1000
         # 2. loop start current_time = 1010
-        # Difference 10 < 60 -> enters grace period sleep
-        with patch("time.time", side_effect=[1000.0, 1010.0, 1010.0, 1010.0]):
-            with patch("time.sleep", side_effect=InterruptedError()) as mock_sleep:
-                try:
-                    monitor._run_monitor()
-                except InterruptedError:
-                    pass
-                mock_sleep.assert_any_call(30)
+        # Difference 10 < 60 -> enters grace period wait
+        clock = iter([1000.0, 1010.0])
+        # Disable logging so record creation doesn't consume clock values
+        logging.disable(logging.CRITICAL)
+        try:
+            with patch("time.time", side_effect=lambda: next(clock, 1010.0)):
+                with patch.object(monitor, "_wait", side_effect=InterruptedError()) as mock_wait:
+                    with patch("time.sleep", side_effect=InterruptedError()):
+                        try:
+                            monitor._run_monitor()
+                        except InterruptedError:
+                            pass
+                    mock_wait.assert_any_call(30.0)
+        finally:
+            logging.disable(logging.NOTSET)
 
     def test_run_monitor_trigger_alert(self, monitor: WatchdogMonitor) -> None:
         """Test monitor triggers alert when timeout occurs"""
@@ -71,19 +80,29 @@ class TestWatchdogMonitor:
         state.status = "ok"
         monitor.watchdog_service.state = state
 
-        # startup=1000, loop_start=1100 (> 60s timeout)
-        with patch("time.time", side_effect=[1000.0, 1100.0, 1100.0, 1100.0, 1100.0]):
-            with patch.object(monitor.watchdog_service, "atomic_update") as mock_atomic:
-                mock_atomic.return_value.__enter__.return_value = state
-
-                with patch("time.sleep", side_effect=InterruptedError()):
-                    try:
-                        monitor._run_monitor()
-                    except InterruptedError:
-                        pass
-
-                assert state.status == "alert"
-                monitor.notifier.send_alert.assert_called_once()  # type: ignore[attr-defined]
+        # Grace period over (monotonic startup=0, now=1000), wall clock at
+        # 1100 (> 60s since the last watchdog at 1000)
+        mono = iter([0.0])
+        # Disable logging so record creation doesn't consume clock values
+        logging.disable(logging.CRITICAL)
+        try:
+            with patch("time.time", return_value=1100.0), patch(
+                "time.monotonic", side_effect=lambda: next(mono, 1000.0)
+            ):
+                with patch.object(monitor.watchdog_service, "atomic_update") as mock_atomic:
+                    mock_atomic.return_value.__enter__.return_value = state
+
+                    with patch.object(monitor, "_wait", side_effect=InterruptedError()):
+                        with patch("time.sleep", side_effect=InterruptedError()):
+                            try:
+                                monitor._run_monitor()
+                            except InterruptedError:
+                                pass
+        finally:
+            logging.disable(logging.NOTSET)
+
+        assert state.status == "alert"
+        monitor.notifier.send_alert.assert_called_once()  # type: ignore[attr-defined]
 
     def test_run_monitor_daily_status(self, monitor: WatchdogMonitor) -> None:
         """Test monitor sends daily status update"""
@@ -95,18 +114,28 @@ class TestWatchdogMonitor:
         state.status = "ok"
         monitor.watchdog_service.state = state
 
-        # startup=0, loop_start=100000.0
-        with patch("time.time", side_effect=[0.0, 100000.0, 100000.0, 100000.0, 100000.0]):
-            with patch.object(monitor.watchdog_service, "atomic_update") as mock_atomic:
-                mock_atomic.return_value.__enter__.return_value = state
-
-                with patch("time.sleep", side_effect=InterruptedError()):
-                    try:
-                        monitor._run_monitor()
-                    except InterruptedError:
-                        pass
-
-                monitor.notifier.send_status_update.assert_called_once()  # type: ignore[attr-defined]
+        # Grace period over (monotonic startup=0, now=100000), wall clock
+        # at 100000.0
+        mono = iter([0.0])
+        # Disable logging so record creation doesn't consume clock values
+        logging.disable(logging.CRITICAL)
+        try:
+            with patch("time.time", return_value=100000.0), patch(
+                "time.monotonic", side_effect=lambda: next(mono, 100000.0)
+            ):
+                with patch.object(monitor.watchdog_service, "atomic_update") as mock_atomic:
+                    mock_atomic.return_value.__enter__.return_value = state
+
+                    with patch.object(monitor, "_wait", side_effect=InterruptedError()):
+                        with patch("time.sleep", side_effect=InterruptedError()):
+                            try:
+                                monitor._run_monitor()
+                            except InterruptedError:
+                                pass
+        finally:
+            logging.disable(logging.NOTSET)
+
+        monitor.notifier.send_status_update.assert_called_once()  # type: ignore[attr-defined]
 
     def test_stop_monitor(self, monitor: WatchdogMonitor) -> None:
         # Currently no stop() method in WatchdogMonitor, it's a daemon thread.
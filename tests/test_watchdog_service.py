@@ -51,6 +51,27 @@ class TestWatchdogService:
         assert success is False
         assert "Expected 'Watchdog'" in message
 
+    def test_process_watchdog_alert_batched_not_first(self, service: WatchdogService) -> None:
+        """Test a grouped batch where the watchdog alert isn't first"""
+        payload: Dict[str, Any] = {
+            "alerts": [
+                {"labels": {"alertname": "OtherAlert"}, "status": "firing"},
+                {
+                    "labels": {"alertname": "Watchdog"},
+                    "status": "firing",
+                    "annotations": {"summary": "Watchdog alert"},
+                },
+            ]
+        }
+
+        success, message = service.process_watchdog_alert(payload)
+
+        assert success is True
+        assert service.state is not None
+        assert service.state.status == "ok"
+        assert service.state.last_watchdog_details is not None
+        assert service.state.last_watchdog_details["alertname"] == "Watchdog"
+
     def test_health_check_timeout(self, service: WatchdogService, mock_config: Config) -> None:
         """Test health check detects timeout"""
         # Simulate last ping was long ago
@@ -114,7 +135,7 @@ class TestWatchdogService:
         service.process_watchdog_alert(payload)
         assert service.state is not None
         assert service.state.status == "ok"
-        service.notifier.send_recovery.assert_called_once()  # type: ignore[attr-defined]
+        service.notifier.send_recovery_async.assert_called_once()  # type: ignore[attr-defined]
 
     def test_get_health_status_initial(self, service: WatchdogService) -> None:
         """Test health status at start"""